@@ -0,0 +1,431 @@
+"""Entorno de simulación sin pantalla para GAME.PY.
+
+Reproduce las reglas del juego (jugador, coches enemigos, turbo, vidas y
+puntuación) sin pygame, con una interfaz tipo gym: reset() / step(action).
+Sirve para ajustar la dificultad y entrenar bots en lotes en lugar de
+probar el juego a mano.
+
+Uso:
+    python game_env.py --episodes 2000 --envs 64 --policy dodge
+"""
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Reglas de GAME.PY (pantalla, carretera y carriles)
+WIDTH, HEIGHT = 800, 600
+ROAD_LEFT = WIDTH // 2 - 150
+ROAD_RIGHT = WIDTH // 2 + 150
+LANES = (-1, 0, 1)
+LANE_SPACING = 50
+PLAYER_WIDTH, PLAYER_HEIGHT = 40, 70
+PLAYER_Y = HEIGHT - 100
+ENEMY_WIDTH, ENEMY_HEIGHT = 40, 70
+FPS = 60
+TURBO_RECHARGE_FRAMES = 5 * FPS  # 5 segundos a 60 FPS
+POINTS_PER_CAR = 10
+
+# Acciones: bits combinables, equivalentes a las teclas del juego
+ACTION_UP = 1
+ACTION_DOWN = 2
+ACTION_LEFT = 4
+ACTION_RIGHT = 8
+ACTION_TURBO = 16
+NUM_ACTIONS = 32
+
+# Parámetros de dificultad (valores por defecto = juego original)
+DEFAULT_CONFIG = {
+    "spawn_interval": 60,      # Frames entre coches enemigos
+    "enemy_speed_min": 3.0,
+    "enemy_speed_max": 7.0,
+    "max_speed": 10.0,
+    "acceleration": 0.1,
+    "deceleration": 0.2,
+    "max_steering": 3.0,
+    "lives": 3,
+    "max_steps": 5 * 60 * FPS,  # Corta el episodio a los 5 minutos de juego
+}
+
+# Observación: x del jugador, velocidad, turbo, vidas y, por carril,
+# distancia y velocidad del coche más cercano que se acerca
+OBS_SIZE = 4 + 2 * len(LANES)
+
+
+def make_config(**overrides):
+    unknown = set(overrides) - set(DEFAULT_CONFIG)
+    if unknown:
+        raise ValueError(f"Parámetros de dificultad desconocidos: {sorted(unknown)}")
+    config = dict(DEFAULT_CONFIG)
+    config.update(overrides)
+
+    if config["spawn_interval"] < 1:
+        raise ValueError("spawn_interval debe ser al menos 1 frame")
+    if config["enemy_speed_min"] <= 0:
+        raise ValueError("enemy_speed_min debe ser mayor que 0")
+    if config["enemy_speed_max"] < config["enemy_speed_min"]:
+        raise ValueError("enemy_speed_max no puede ser menor que enemy_speed_min")
+    for key in ("max_speed", "lives", "max_steps"):
+        if config[key] <= 0:
+            raise ValueError(f"{key} debe ser mayor que 0")
+    return config
+
+
+class RaceEnv:
+    """Una partida de GAME.PY, paso a paso y sin pantalla"""
+
+    def __init__(self, config=None, seed=None):
+        self.config = make_config(**(config or {}))
+        self.rng = random.Random(seed)
+        self.reset()
+
+    def reset(self):
+        self.x = WIDTH // 2
+        self.speed = 0.0
+        self.lives = self.config["lives"]
+        self.score = 0
+        self.turbo_available = True
+        self.turbo_frame = 0
+        self.spawn_timer = 0
+        self.steps = 0
+        self.enemies = []  # Listas [lane, y, speed]
+        return self._observe()
+
+    def step(self, action):
+        cfg = self.config
+        max_speed = cfg["max_speed"]
+
+        # Turbo (se procesa antes que el movimiento, como los eventos del juego)
+        if action & ACTION_TURBO and self.turbo_available:
+            self.speed = max_speed * 1.5
+            self.turbo_available = False
+            self.turbo_frame = self.steps
+
+        # Aceleración y frenado
+        if action & ACTION_UP:
+            self.speed = min(self.speed + cfg["acceleration"], max_speed)
+        elif action & ACTION_DOWN:
+            self.speed = max(self.speed - cfg["deceleration"] * 2, -max_speed / 2)
+        elif self.speed > 0:
+            self.speed = max(self.speed - cfg["deceleration"] / 2, 0)
+        elif self.speed < 0:
+            self.speed = min(self.speed + cfg["deceleration"] / 2, 0)
+
+        # Dirección
+        if action & ACTION_LEFT:
+            steering = -cfg["max_steering"]
+        elif action & ACTION_RIGHT:
+            steering = cfg["max_steering"]
+        else:
+            steering = 0
+        self.x += steering * (self.speed / max_speed)
+        self.x = max(ROAD_LEFT + PLAYER_WIDTH // 2, min(self.x, ROAD_RIGHT - PLAYER_WIDTH // 2))
+
+        # Generar coches enemigos
+        self.spawn_timer += 1
+        if self.spawn_timer >= cfg["spawn_interval"]:
+            self.enemies.append([
+                self.rng.choice(LANES),
+                -ENEMY_HEIGHT,
+                self.rng.uniform(cfg["enemy_speed_min"], cfg["enemy_speed_max"]),
+            ])
+            self.spawn_timer = 0
+
+        # Actualizar coches enemigos y colisiones
+        reward = 0
+        remaining = []
+        for enemy in self.enemies:
+            enemy[1] += enemy[2]
+            enemy_x = WIDTH // 2 + enemy[0] * LANE_SPACING
+            if (abs(self.x - enemy_x) < (PLAYER_WIDTH + ENEMY_WIDTH) // 2 and
+                    abs(PLAYER_Y - enemy[1]) < (PLAYER_HEIGHT + ENEMY_HEIGHT) // 2):
+                self.lives -= 1
+            elif enemy[1] > HEIGHT + ENEMY_HEIGHT:
+                reward += POINTS_PER_CAR
+            else:
+                remaining.append(enemy)
+        self.enemies = remaining
+        self.score += reward
+
+        # Recargar turbo
+        if not self.turbo_available and self.steps - self.turbo_frame > TURBO_RECHARGE_FRAMES:
+            self.turbo_available = True
+
+        self.steps += 1
+        done = self.lives <= 0
+        truncated = self.steps >= cfg["max_steps"]
+        info = {"score": self.score, "lives": self.lives, "truncated": truncated}
+        return self._observe(), reward, done or truncated, info
+
+    def _observe(self):
+        obs = np.ones(OBS_SIZE, dtype=np.float32)
+        obs[0] = (self.x - ROAD_LEFT) / (ROAD_RIGHT - ROAD_LEFT)
+        obs[1] = self.speed / self.config["max_speed"]
+        obs[2] = self.turbo_available
+        obs[3] = self.lives
+        obs[4 + len(LANES):] = 0
+        for lane, y, speed in self.enemies:
+            gap = (PLAYER_Y - y) / HEIGHT
+            column = 4 + LANES.index(lane)
+            if gap > -PLAYER_HEIGHT / HEIGHT and gap < obs[column]:
+                obs[column] = gap
+                obs[column + len(LANES)] = speed
+        return obs
+
+
+class VecRaceEnv:
+    """N partidas simultáneas en arreglos de NumPy.
+
+    Las partidas terminadas se reinician solas; su puntuación final queda en
+    info["score"] para las filas con done=True. Las filas con running=False
+    nunca reportan done.
+    """
+
+    def __init__(self, num_envs, config=None, seed=None):
+        self.num_envs = num_envs
+        self.config = make_config(**(config or {}))
+        self.rng = np.random.default_rng(seed)
+
+        # Máximo de coches vivos a la vez por partida
+        frames_on_screen = (HEIGHT + 2 * ENEMY_HEIGHT) / self.config["enemy_speed_min"] + 1
+        self.capacity = int(np.ceil(frames_on_screen / self.config["spawn_interval"])) + 1
+
+        n = num_envs
+        self.x = np.empty(n)
+        self.speed = np.empty(n)
+        self.lives = np.empty(n, dtype=np.int64)
+        self.score = np.empty(n, dtype=np.int64)
+        self.turbo_available = np.empty(n, dtype=bool)
+        self.turbo_frame = np.empty(n, dtype=np.int64)
+        self.spawn_timer = np.empty(n, dtype=np.int64)
+        self.steps = np.empty(n, dtype=np.int64)
+        self.enemy_lane = np.zeros((n, self.capacity), dtype=np.int64)
+        self.enemy_y = np.zeros((n, self.capacity))
+        self.enemy_speed = np.zeros((n, self.capacity))
+        self.enemy_active = np.zeros((n, self.capacity), dtype=bool)
+        # Filas cuyas partidas se reportan; las demás siguen simulando sin contar
+        self.running = np.ones(n, dtype=bool)
+
+    def reset(self):
+        self._reset_rows(np.ones(self.num_envs, dtype=bool))
+        return self._observe()
+
+    def _reset_rows(self, rows):
+        self.x[rows] = WIDTH // 2
+        self.speed[rows] = 0.0
+        self.lives[rows] = self.config["lives"]
+        self.score[rows] = 0
+        self.turbo_available[rows] = True
+        self.turbo_frame[rows] = 0
+        self.spawn_timer[rows] = 0
+        self.steps[rows] = 0
+        self.enemy_active[rows] = False
+
+    def step(self, actions):
+        cfg = self.config
+        max_speed = cfg["max_speed"]
+        actions = np.asarray(actions)
+        up = (actions & ACTION_UP) != 0
+        down = (actions & ACTION_DOWN) != 0
+        left = (actions & ACTION_LEFT) != 0
+        right = (actions & ACTION_RIGHT) != 0
+
+        # Turbo
+        turbo = ((actions & ACTION_TURBO) != 0) & self.turbo_available
+        self.speed[turbo] = max_speed * 1.5
+        self.turbo_available &= ~turbo
+        self.turbo_frame[turbo] = self.steps[turbo]
+
+        # Aceleración y frenado
+        coast = np.where(self.speed > 0,
+                         np.maximum(self.speed - cfg["deceleration"] / 2, 0),
+                         np.minimum(self.speed + cfg["deceleration"] / 2, 0))
+        self.speed = np.where(up, np.minimum(self.speed + cfg["acceleration"], max_speed),
+                              np.where(down, np.maximum(self.speed - cfg["deceleration"] * 2, -max_speed / 2),
+                                       coast))
+
+        # Dirección
+        steering = np.where(left, -cfg["max_steering"], np.where(right, cfg["max_steering"], 0.0))
+        self.x = np.clip(self.x + steering * (self.speed / max_speed),
+                         ROAD_LEFT + PLAYER_WIDTH // 2, ROAD_RIGHT - PLAYER_WIDTH // 2)
+
+        # Generar coches enemigos en el primer hueco libre de cada partida
+        self.spawn_timer += 1
+        spawning = np.flatnonzero(self.spawn_timer >= cfg["spawn_interval"])
+        if spawning.size:
+            if self.enemy_active[spawning].all(axis=1).any():
+                raise RuntimeError(f"Sin espacio para más coches enemigos (capacidad {self.capacity})")
+            slots = np.argmin(self.enemy_active[spawning], axis=1)
+            self.enemy_lane[spawning, slots] = self.rng.integers(-1, 2, spawning.size)
+            self.enemy_y[spawning, slots] = -ENEMY_HEIGHT
+            self.enemy_speed[spawning, slots] = self.rng.uniform(
+                cfg["enemy_speed_min"], cfg["enemy_speed_max"], spawning.size)
+            self.enemy_active[spawning, slots] = True
+            self.spawn_timer[spawning] = 0
+
+        # Actualizar coches enemigos y colisiones
+        active = self.enemy_active
+        self.enemy_y += self.enemy_speed * active
+        enemy_x = WIDTH // 2 + self.enemy_lane * LANE_SPACING
+        hit = (active &
+               (np.abs(self.x[:, None] - enemy_x) < (PLAYER_WIDTH + ENEMY_WIDTH) // 2) &
+               (np.abs(PLAYER_Y - self.enemy_y) < (PLAYER_HEIGHT + ENEMY_HEIGHT) // 2))
+        passed = active & ~hit & (self.enemy_y > HEIGHT + ENEMY_HEIGHT)
+        self.enemy_active = active & ~(hit | passed)
+        self.lives -= hit.sum(axis=1)
+        rewards = POINTS_PER_CAR * passed.sum(axis=1)
+        self.score += rewards
+
+        # Recargar turbo
+        self.turbo_available |= self.steps - self.turbo_frame > TURBO_RECHARGE_FRAMES
+
+        self.steps += 1
+        truncated = self.steps >= cfg["max_steps"]
+        finished = (self.lives <= 0) | truncated
+        dones = finished & self.running
+        info = {"score": self.score.copy(), "steps": self.steps.copy(), "truncated": truncated}
+        if finished.any():
+            self._reset_rows(finished)
+        return self._observe(), rewards, dones, info
+
+    def _observe(self):
+        obs = np.empty((self.num_envs, OBS_SIZE), dtype=np.float32)
+        obs[:, 0] = (self.x - ROAD_LEFT) / (ROAD_RIGHT - ROAD_LEFT)
+        obs[:, 1] = self.speed / self.config["max_speed"]
+        obs[:, 2] = self.turbo_available
+        obs[:, 3] = self.lives
+
+        gap = (PLAYER_Y - self.enemy_y) / HEIGHT
+        approaching = self.enemy_active & (gap > -PLAYER_HEIGHT / HEIGHT)
+        for i, lane in enumerate(LANES):
+            lane_gap = np.where(approaching & (self.enemy_lane == lane), gap, np.inf)
+            nearest = np.argmin(lane_gap, axis=1)
+            nearest_gap = lane_gap[np.arange(self.num_envs), nearest]
+            found = np.isfinite(nearest_gap)
+            obs[:, 4 + i] = np.where(found, nearest_gap, 1.0)
+            obs[:, 4 + len(LANES) + i] = np.where(
+                found, self.enemy_speed[np.arange(self.num_envs), nearest], 0.0)
+        return obs
+
+
+# Políticas de ejemplo: reciben observaciones (N, OBS_SIZE) y devuelven N acciones
+def random_policy(obs, rng):
+    return rng.integers(0, NUM_ACTIONS, len(obs))
+
+
+def dodge_policy(obs, rng):
+    """Acelera siempre y se mueve hacia el carril más despejado"""
+    x = ROAD_LEFT + obs[:, 0] * (ROAD_RIGHT - ROAD_LEFT)
+    target = WIDTH // 2 + (np.argmax(obs[:, 4:4 + len(LANES)], axis=1) - 1) * LANE_SPACING
+    actions = np.full(len(obs), ACTION_UP)
+    actions[x < target - 2] |= ACTION_RIGHT
+    actions[x > target + 2] |= ACTION_LEFT
+    return actions
+
+
+POLICIES = {
+    "random": random_policy,
+    "dodge": dodge_policy,
+}
+
+
+def check_counts(**counts):
+    """Valida que cada cantidad (partidas, entornos, procesos) sea al menos 1"""
+    for name, value in counts.items():
+        if value < 1:
+            raise ValueError(f"{name} debe ser al menos 1")
+
+
+def run_batch(config, episodes, num_envs, policy_name, seed):
+    """Juega `episodes` partidas con un VecRaceEnv y devuelve (puntuaciones, frames).
+
+    Cada fila juega un número fijo de partidas y luego deja de contar; si se
+    tomaran las primeras partidas en terminar, las más largas (y de mayor
+    puntuación) quedarían fuera de la muestra.
+    """
+    check_counts(episodes=episodes, envs=num_envs)
+    policy = POLICIES[policy_name]
+    rng = np.random.default_rng(seed)
+    env = VecRaceEnv(num_envs, config, seed=rng.integers(2**32))
+    obs = env.reset()
+    remaining = episodes // num_envs + (np.arange(num_envs) < episodes % num_envs)
+    env.running = remaining > 0
+    scores = []
+    frames = 0
+    while env.running.any():
+        frames += int(env.running.sum())
+        obs, rewards, dones, info = env.step(policy(obs, rng))
+        scores.extend(info["score"][dones].tolist())
+        remaining -= dones
+        env.running &= remaining > 0
+    return scores, frames
+
+
+def simulate(config=None, episodes=1000, num_envs=64, workers=None, policy="dodge", seed=0):
+    """Reparte las partidas entre procesos y agrega las estadísticas"""
+    if workers is None:
+        workers = os.cpu_count() or 1
+    check_counts(episodes=episodes, envs=num_envs, workers=workers)
+    per_worker = [episodes // workers + (i < episodes % workers) for i in range(workers)]
+    per_worker = [count for count in per_worker if count]
+
+    start = time.perf_counter()
+    scores = []
+    frames = 0
+    with ProcessPoolExecutor(max_workers=len(per_worker)) as pool:
+        futures = [pool.submit(run_batch, config, count, min(num_envs, count), policy, seed + i)
+                   for i, count in enumerate(per_worker)]
+        for future in futures:
+            batch_scores, batch_frames = future.result()
+            scores.extend(batch_scores)
+            frames += batch_frames
+    elapsed = time.perf_counter() - start
+
+    scores = np.asarray(scores)
+    return {
+        "episodes": len(scores),
+        "workers": len(per_worker),
+        "seconds": elapsed,
+        "episodes_per_sec": len(scores) / elapsed,
+        "frames_per_sec": frames / elapsed,
+        "score_mean": float(scores.mean()),
+        "score_std": float(scores.std()),
+        "score_min": int(scores.min()),
+        "score_p50": float(np.percentile(scores, 50)),
+        "score_p90": float(np.percentile(scores, 90)),
+        "score_max": int(scores.max()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulación por lotes de GAME.PY")
+    parser.add_argument("--episodes", type=int, default=1000, help="Partidas a simular")
+    parser.add_argument("--envs", type=int, default=64, help="Partidas simultáneas por proceso")
+    parser.add_argument("--workers", type=int, default=None, help="Procesos (por defecto, todos los núcleos)")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="dodge")
+    parser.add_argument("--seed", type=int, default=0)
+    for key, value in DEFAULT_CONFIG.items():
+        parser.add_argument(f"--{key.replace('_', '-')}", dest=key, type=type(value), default=value)
+    args = parser.parse_args()
+
+    try:
+        check_counts(episodes=args.episodes, envs=args.envs)
+        if args.workers is not None:
+            check_counts(workers=args.workers)
+        config = make_config(**{key: getattr(args, key) for key in DEFAULT_CONFIG})
+    except ValueError as e:
+        parser.error(str(e))
+    stats = simulate(config, args.episodes, args.envs, args.workers, args.policy, args.seed)
+
+    print(f"Partidas: {stats['episodes']} en {stats['seconds']:.2f} s con {stats['workers']} procesos")
+    print(f"Partidas/s: {stats['episodes_per_sec']:.1f}  Frames/s: {stats['frames_per_sec']:.0f}")
+    print(f"Puntuación: media {stats['score_mean']:.1f} ± {stats['score_std']:.1f}, "
+          f"mín {stats['score_min']}, p50 {stats['score_p50']:.0f}, "
+          f"p90 {stats['score_p90']:.0f}, máx {stats['score_max']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,419 +1,709 @@
-import cv2 
-import mediapipe as mp 
-import serial 
-import time 
-import numpy as np 
-from matplotlib.backends.backend_agg import FigureCanvasAgg 
-from matplotlib import pyplot as plt 
-import pygame 
-from pygame.locals import * 
-
-# Configuración serial - cambiar COM según tu sistema 
-SERIAL_PORT = 'COM3'  
-BAUD_RATE = 9600 
-
-try: 
-    arduino = serial.Serial(SERIAL_PORT, BAUD_RATE, timeout=1) 
-    time.sleep(2)  # Espera para inicialización 
-    print(f"Conexión establecida con Arduino en {SERIAL_PORT}") 
-except serial.SerialException as e: 
-    print(f"Error de conexión: {e}") 
-    arduino = None 
-
-# Configuración de MediaPipe Hands 
-mp_hands = mp.solutions.hands 
-mp_drawing = mp.solutions.drawing_utils 
-mp_drawing_styles = mp.solutions.drawing_styles 
-
-hands = mp_hands.Hands( 
-    max_num_hands=1, 
-    min_detection_confidence=0.8, 
-    min_tracking_confidence=0.8 
-) 
-
-# Inicializar cámara 
-cap = cv2.VideoCapture(0) 
-
-if not cap.isOpened(): 
-    print("Error al abrir la cámara") 
-    exit() 
-
-# Inicializar pygame para interfaz gráfica 
-pygame.init() 
-info = pygame.display.Info() 
-screen_width, screen_height = info.current_w - 100, info.current_h - 100 
-screen = pygame.display.set_mode((screen_width, screen_height)) 
-pygame.display.set_caption("Control por Gestos - Sistema de Domótica") 
-
-# Colores 
-WHITE = (255, 255, 255) 
-BLACK = (0, 0, 0) 
-GREEN = (0, 255, 0) 
-RED = (255, 0, 0) 
-BLUE = (0, 0, 255) 
-YELLOW = (255, 255, 0) 
-ORANGE = (255, 165, 0) 
-
-# Fuentes 
-font_large = pygame.font.SysFont('Arial', 30) 
-font_medium = pygame.font.SysFont('Arial', 24) 
-font_small = pygame.font.SysFont('Arial', 18) 
-
-# Mapeo de gestos a comandos 
-GESTURE_COMMANDS = { 
-    "00000": {"cmd": "ALL_OFF", "desc": "Puño cerrado - Apagar todo", "color": RED},           
-    "11111": {"cmd": "LED_ON", "desc": "Mano abierta - Encender luces", "color": GREEN},            
-    "01100": {"cmd": "FAN_ON", "desc": "Paz y amor - Ventilador ON", "color": BLUE},            
-    "01111": {"cmd": "FAN_OFF", "desc": "Cuatro dedos - Ventilador OFF", "color": RED},      
-    "10000": {"cmd": "BUZZER_ON", "desc": "Solo pulgar - Alarma sonora", "color": ORANGE},         
-    "00111": {"cmd": "DOOR_OPEN", "desc": "Tres dedos - Abrir puerta", "color": GREEN},         
-    "00001": {"cmd": "DOOR_CLOSE", "desc": "Solo meñique - Cerrar puerta", "color": RED},        
-    "01000": {"cmd": "DOOR_SET_ANGLE=90", "desc": "Solo índice - Ángulo 90°", "color": YELLOW}, 
-    "11000": {"cmd": "FAN_REVERSE", "desc": "Pulgar + índice - Reversa ventilador", "color": ORANGE} 
-} 
-
-# Estados adicionales para control progresivo 
-GESTURE_CONTROL = { 
-    "11111": {"action": "INCREASE", "target": "SERVO", "step": 5}, 
-    "00000": {"action": "DECREASE", "target": "SERVO", "step": 5}, 
-    "10101": {"action": "INCREASE", "target": "FAN", "step": 25}, 
-    "01010": {"action": "DECREASE", "target": "FAN", "step": 25} 
-} 
-
-def count_fingers(hand_landmarks): 
-    tips_ids = [4, 8, 12, 16, 20]  # Pulgar, índice, medio, anular, meñique 
-    fingers = [] 
-    
-    # Detección pulgar (comparación eje X) 
-    thumb_tip = hand_landmarks.landmark[tips_ids[0]] 
-    thumb_dip = hand_landmarks.landmark[tips_ids[0]-1] 
-    fingers.append(1 if thumb_tip.x < thumb_dip.x else 0) 
-    
-    # Detección otros dedos (comparación eje Y) 
-    for id in range(1, 5): 
-        tip = hand_landmarks.landmark[tips_ids[id]] 
-        dip = hand_landmarks.landmark[tips_ids[id]-2] 
-        fingers.append(1 if tip.y < dip.y else 0) 
-    
-    return "".join(map(str, fingers)) 
-
-def send_command(cmd): 
-    if arduino: 
-        try: 
-            arduino.write(f"{cmd}\n".encode()) 
-            print(f"Comando enviado: {cmd}") 
-            return True 
-        except Exception as e: 
-            print(f"Error enviando comando: {e}") 
-            return False 
-    else: 
-        print(f"Simulando comando: {cmd}") 
-        return True 
-
-def draw_hand_graph(hand_landmarks, size=(300, 300)): 
-    """Crea una gráfica de los puntos de la mano usando matplotlib""" 
-    fig, ax = plt.subplots(figsize=(4, 4), facecolor='black') 
-    fig.subplots_adjust(left=0, right=1, bottom=0, top=1) 
-    ax.set_xlim(0, 1) 
-    ax.set_ylim(1, 0)  # Invertir eje Y para coincidir con imagen 
-    ax.axis('off') 
-    
-    # Dibujar conexiones 
-    connections = mp_hands.HAND_CONNECTIONS 
-    for connection in connections: 
-        start_idx = connection[0] 
-        end_idx = connection[1] 
-        start = hand_landmarks.landmark[start_idx] 
-        end = hand_landmarks.landmark[end_idx] 
-        ax.plot([start.x, end.x], [start.y, end.y], 'w-', linewidth=2) 
-    
-    # Dibujar puntos 
-    for landmark in hand_landmarks.landmark: 
-        ax.plot(landmark.x, landmark.y, 'ro', markersize=5) 
-    
-    # Convertir a superficie pygame 
-    canvas = FigureCanvasAgg(fig) 
-    canvas.draw() 
-    renderer = canvas.get_renderer() 
-    raw_data = renderer.tostring_argb() 
-    plt.close(fig) 
-    
-    # Cambiado de "RGB" a "ARGB" y ajustado el tamaño 
-    size_pixels = (int(renderer.width), int(renderer.height)) 
-    surf = pygame.image.fromstring(raw_data, size_pixels, "ARGB") 
-    return pygame.transform.scale(surf, size) 
-
-def draw_gesture_info(surface, finger_state, command, servo_angle, fan_speed): 
-    """Dibuja información sobre el gesto detectado""" 
-    # Fondo del panel de información 
-    pygame.draw.rect(surface, (30, 30, 40), (0, 0, surface.get_width(), 120)) 
-    
-    # Texto de estado de dedos 
-    gesture_data = GESTURE_COMMANDS.get(finger_state, {"desc": "Gestos no reconocido", "color": WHITE}) 
-    fingers_text = font_large.render(f"Estado de dedos: {finger_state}", True, gesture_data["color"]) 
-    surface.blit(fingers_text, (20, 20)) 
-    
-    # Descripción del gesto 
-    gesture_text = font_medium.render(f"Gesto: {gesture_data['desc']}", True, WHITE) 
-    surface.blit(gesture_text, (20, 55)) 
-    
-    # Comando actual 
-    cmd_text = font_medium.render(f"Comando: {command if command else 'Ninguno'}", True, GREEN if command else RED) 
-    surface.blit(cmd_text, (surface.get_width() - 400, 20)) 
-    
-    # Ángulo del servo 
-    servo_text = font_medium.render(f"Ángulo puerta: {servo_angle}°", True, WHITE) 
-    surface.blit(servo_text, (surface.get_width() - 400, 55)) 
-    
-    # Velocidad ventilador 
-    fan_text = font_medium.render(f"Veloc. ventilador: {fan_speed}/255", True, WHITE) 
-    surface.blit(fan_text, (surface.get_width() - 400, 85)) 
-
-def draw_device_status(surface, devices): 
-    """Dibuja el estado de los dispositivos""" 
-    # Fondo del panel de estado 
-    pygame.draw.rect(surface, (40, 40, 50), (0, surface.get_height() - 150, surface.get_width(), 150)) 
-    
-    # Título 
-    status_title = font_large.render("Estado de Dispositivos:", True, YELLOW) 
-    surface.blit(status_title, (20, surface.get_height() - 140)) 
-    
-    # Dispositivos 
-    for i, device in enumerate(devices): 
-        x_pos = 20 + (i * 250) 
-        if x_pos < surface.get_width() - 200: 
-            # Icono representativo 
-            icon = font_large.render(device["icon"], True, device["color"]) 
-            surface.blit(icon, (x_pos, surface.get_height() - 100)) 
-            
-            # Texto del estado 
-            state_text = font_medium.render(device["state"], True, device["color"]) 
-            surface.blit(state_text, (x_pos + 40, surface.get_height() - 100)) 
-            
-            # Barra de progreso para elementos con valores 
-            if "value" in device: 
-                pygame.draw.rect(surface, (70, 70, 80), (x_pos, surface.get_height() - 60, 200, 20)) 
-                pygame.draw.rect(surface, device["color"], (x_pos, surface.get_height() - 60, int(200 * (device["value"]/device["max"])), 20)) 
-                value_text = font_small.render(f"{device['value']}/{device['max']}", True, WHITE) 
-                surface.blit(value_text, (x_pos + 80, surface.get_height() - 55)) 
-
-def parse_status_message(message): 
-    """Parsea el mensaje de estado del Arduino""" 
-    if not message.startswith("status:"): 
-        return None 
-    
-    status_data = {} 
-    parts = message[7:].strip().split(",") 
-    for part in parts: 
-        key, value = part.split("=") 
-        status_data[key] = value 
-    
-    return status_data 
-
-prev_command = None 
-servo_angle = 90  # Ángulo inicial del servo 
-fan_speed = 0     # Velocidad inicial del ventilador 
-clock = pygame.time.Clock() 
-running = True 
-last_status = {} 
-gesture_active_time = 0 
-current_gesture = None 
-
-# Dispositivos iniciales 
-devices = [ 
-    {"name": "Luces", "state": "OFF", "color": RED, "icon": "💡", "cmd_on": "LED_ON", "cmd_off": "LED_OFF"}, 
-    {"name": "Ventilador", "state": "OFF", "color": RED, "icon": "🌀", "value": 0, "max": 255, "cmd_on": "FAN_ON", "cmd_off": "FAN_OFF", "cmd_reverse": "FAN_REVERSE"}, 
-    {"name": "Alarma", "state": "OFF", "color": RED, "icon": "🚨", "cmd_on": "BUZZER_ON"}, 
-    {"name": "Puerta", "state": "90°", "color": BLUE, "icon": "🚪", "value": 90, "max": 180, "cmd_open": "DOOR_OPEN", "cmd_close": "DOOR_CLOSE"} 
-] 
-
-while running: 
-    for event in pygame.event.get(): 
-        if event.type == QUIT or (event.type == KEYDOWN and event.key == K_ESCAPE): 
-            running = False 
-        elif event.type == KEYDOWN: 
-            if event.key == K_1: 
-                send_command("LED_ON") 
-            elif event.key == K_2: 
-                send_command("LED_OFF") 
-            elif event.key == K_3: 
-                send_command("FAN_ON") 
-            elif event.key == K_4: 
-                send_command("FAN_OFF") 
-            elif event.key == K_5: 
-                send_command("BUZZER_ON") 
-            elif event.key == K_6: 
-                send_command("DOOR_OPEN") 
-            elif event.key == K_7: 
-                send_command("DOOR_CLOSE") 
-            elif event.key == K_0: 
-                send_command("ALL_OFF") 
-            elif event.key == K_r: 
-                send_command("FAN_REVERSE") 
-
-    # Leer estado del Arduino si hay datos disponibles 
-    if arduino and arduino.in_waiting > 0: 
-        try: 
-            status_message = arduino.readline().decode().strip() 
-            last_status = parse_status_message(status_message) or last_status 
-            print(f"Estado recibido: {status_message}") 
-        except Exception as e: 
-            print(f"Error leyendo estado: {e}") 
-
-    # Actualizar dispositivos basado en el último estado 
-    if last_status: 
-        for device in devices: 
-            if device["name"] == "Luces": 
-                device["state"] = "ON" if last_status.get("led", "") == "on" else "OFF" 
-                device["color"] = GREEN if device["state"] == "ON" else RED 
-            elif device["name"] == "Ventilador": 
-                speed = int(last_status.get("fan", "0")) 
-                device["value"] = speed 
-                device["state"] = f"{speed}/255" 
-                device["color"] = GREEN if speed > 0 else RED 
-                if "fan_dir" in last_status: 
-                    if last_status["fan_dir"] == "reverse": 
-                        device["state"] += " (R)" 
-            elif device["name"] == "Alarma": 
-                device["state"] = "ON" if last_status.get("buzzer", "") == "on" else "OFF" 
-                device["color"] = ORANGE if device["state"] == "ON" else RED 
-            elif device["name"] == "Puerta": 
-                angle = int(last_status.get("door", "90")) 
-                device["value"] = angle 
-                device["state"] = f"{angle}°" 
-                servo_angle = angle 
-
-    # Capturar frame de la cámara 
-    ret, frame = cap.read() 
-    if not ret: 
-        continue 
-
-    frame = cv2.flip(frame, 1) 
-    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB) 
-    results = hands.process(rgb_frame) 
-
-    command = None 
-    finger_state = "-----" 
-    hand_graph_surf = None 
-
-    if results.multi_hand_landmarks: 
-        for hand_landmarks in results.multi_hand_landmarks: 
-            # Procesar gestos 
-            finger_state = count_fingers(hand_landmarks) 
-            gesture_info = GESTURE_COMMANDS.get(finger_state, {}) 
-            command = gesture_info.get("cmd", None) 
-            
-            # Crear gráfico de la mano 
-            try: 
-                hand_graph_surf = draw_hand_graph(hand_landmarks) 
-            except Exception as e: 
-                print(f"Error al dibujar gráfico de mano: {e}") 
-                hand_graph_surf = None 
-
-            # Control progresivo con gestos especiales 
-            control_action = GESTURE_CONTROL.get(finger_state, {}) 
-            if control_action: 
-                if current_gesture != finger_state: 
-                    current_gesture = finger_state 
-                    gesture_active_time = time.time() 
-                
-                # Aplicar acción continua si el gesto se mantiene 
-                if time.time() - gesture_active_time > 0.5:  # Retardo antes de acción continua 
-                    if control_action["target"] == "SERVO": 
-                        step = control_action["step"] * (1 if control_action["action"] == "INCREASE" else -1) 
-                        servo_angle = max(0, min(180, servo_angle + step)) 
-                        command = f"DOOR_SET_ANGLE={servo_angle}" 
-                    elif control_action["target"] == "FAN": 
-                        step = control_action["step"] * (1 if control_action["action"] == "INCREASE" else -1) 
-                        fan_speed = max(0, min(255, fan_speed + step)) 
-                        command = f"FAN_SPEED={fan_speed}" 
-            else: 
-                current_gesture = None 
-
-    # Envío de comandos con deduplicación 
-    if command and command != prev_command: 
-        if send_command(command): 
-            prev_command = command 
-            # Actualizar estado local inmediatamente para mejor feedback 
-            if command == "LED_ON": 
-                for device in devices: 
-                    if device["name"] == "Luces": 
-                        device["state"] = "ON" 
-                        device["color"] = GREEN 
-            elif command == "LED_OFF": 
-                for device in devices: 
-                    if device["name"] == "Luces": 
-                        device["state"] = "OFF" 
-                        device["color"] = RED 
-            elif command == "FAN_ON": 
-                for device in devices: 
-                    if device["name"] == "Ventilador": 
-                        device["state"] = "255/255" 
-                        device["color"] = GREEN 
-                        device["value"] = 255 
-            elif command == "FAN_OFF": 
-                for device in devices: 
-                    if device["name"] == "Ventilador": 
-                        device["state"] = "0/255" 
-                        device["color"] = RED 
-                        device["value"] = 0 
-            elif command.startswith("FAN_SPEED="): 
-                speed = int(command.split("=")[1]) 
-                for device in devices: 
-                    if device["name"] == "Ventilador": 
-                        device["state"] = f"{speed}/255" 
-                        device["color"] = GREEN if speed > 0 else RED 
-                        device["value"] = speed 
-            elif command == "FAN_REVERSE": 
-                for device in devices: 
-                    if device["name"] == "Ventilador": 
-                        device["state"] = "255/255 (R)" 
-                        device["color"] = ORANGE 
-                        device["value"] = 255 
-            elif command.startswith("DOOR_SET_ANGLE="): 
-                angle = int(command.split("=")[1]) 
-                for device in devices: 
-                    if device["name"] == "Puerta": 
-                        device["state"] = f"{angle}°" 
-                        device["value"] = angle 
-                        servo_angle = angle 
-
-    # Convertir frame de OpenCV a Pygame 
-    frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB) 
-    frame = np.rot90(frame) 
-    frame = pygame.surfarray.make_surface(frame) 
-    frame = pygame.transform.scale(frame, (screen_width // 2, screen_height - 150)) 
-
-    # Limpiar pantalla 
-    screen.fill(BLACK) 
-
-    # Dibujar frame de la cámara 
-    screen.blit(frame, (20, 130)) 
-
-    # Dibujar gráfico de la mano si está disponible 
-    if hand_graph_surf: 
-        screen.blit(hand_graph_surf, (screen_width // 2 + 40, 130)) 
-    else: 
-        no_hand_text = font_large.render("Muestra tu mano a la cámara", True, WHITE) 
-        screen.blit(no_hand_text, (screen_width // 2 + 100, screen_height // 2)) 
-
-    # Dibujar información de gestos 
-    draw_gesture_info(screen, finger_state, command, servo_angle, fan_speed) 
-
-    # Dibujar estado de dispositivos 
-    draw_device_status(screen, devices) 
-
-    # Dibujar ayuda de teclado 
-    help_text = font_small.render("Teclas: 1=LED ON, 2=LED OFF, 3=FAN ON, 4=FAN OFF, 5=BUZZER, 6=OPEN, 7=CLOSE, 0=ALL OFF, R=REVERSE", True, WHITE) 
-    screen.blit(help_text, (20, screen_height - 30)) 
-
-    # Actualizar pantalla 
-    pygame.display.flip() 
-    clock.tick(30) 
-
-# Liberar recursos 
-hands.close() 
-cap.release() 
-pygame.quit() 
-if arduino: 
-    arduino.close()
\ No newline at end of file
+import argparse
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from pygame.locals import *
+
+# cv2, mediapipe, serial y matplotlib se importan de forma diferida: el
+# arranque pesado ocurre en hilos mientras la ventana ya está abierta
+
+# Configuración serial - cambiar COM según tu sistema
+SERIAL_PORT = 'COM3'
+BAUD_RATE = 9600
+ARDUINO_RESET_DELAY = 2  # Segundos de espera para inicialización del Arduino
+
+# Presupuesto de arranque (segundos hasta procesar el primer frame)
+STARTUP_BUDGET = 3.0
+
+# Colores
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+GREEN = (0, 255, 0)
+RED = (255, 0, 0)
+BLUE = (0, 0, 255)
+YELLOW = (255, 255, 0)
+ORANGE = (255, 165, 0)
+COLORS = {"WHITE": WHITE, "BLACK": BLACK, "GREEN": GREEN, "RED": RED, "BLUE": BLUE, "YELLOW": YELLOW, "ORANGE": ORANGE}
+
+# Mapeo de gestos a comandos (dedos: pulgar, índice, medio, anular, meñique)
+GESTURE_COMMANDS = {
+    "00000": {"cmd": "ALL_OFF", "desc": "Puño cerrado - Apagar todo", "color": RED},
+    "11111": {"cmd": "LED_ON", "desc": "Mano abierta - Encender luces", "color": GREEN},
+    "01100": {"cmd": "FAN_ON", "desc": "Paz y amor - Ventilador ON", "color": BLUE},
+    "01111": {"cmd": "FAN_OFF", "desc": "Cuatro dedos - Ventilador OFF", "color": RED},
+    "10000": {"cmd": "BUZZER_ON", "desc": "Solo pulgar - Alarma sonora", "color": ORANGE},
+    "00111": {"cmd": "DOOR_OPEN", "desc": "Tres dedos - Abrir puerta", "color": GREEN},
+    "00001": {"cmd": "DOOR_CLOSE", "desc": "Solo meñique - Cerrar puerta", "color": RED},
+    "01000": {"cmd": "DOOR_SET_ANGLE=90", "desc": "Solo índice - Ángulo 90°", "color": YELLOW},
+    "11000": {"cmd": "FAN_REVERSE", "desc": "Pulgar + índice - Reversa ventilador", "color": ORANGE}
+}
+
+# Estados adicionales para control progresivo
+GESTURE_CONTROL = {
+    "11111": {"action": "INCREASE", "target": "SERVO", "step": 5},
+    "00000": {"action": "DECREASE", "target": "SERVO", "step": 5},
+    "10101": {"action": "INCREASE", "target": "FAN", "step": 25},
+    "01010": {"action": "DECREASE", "target": "FAN", "step": 25}
+}
+
+# Teclas (sufijo de las constantes K_ de pygame: "1", "r", "F1"...) a comandos
+KEY_COMMANDS = {
+    "1": "LED_ON",
+    "2": "LED_OFF",
+    "3": "FAN_ON",
+    "4": "FAN_OFF",
+    "5": "BUZZER_ON",
+    "6": "DOOR_OPEN",
+    "7": "DOOR_CLOSE",
+    "0": "ALL_OFF",
+    "r": "FAN_REVERSE"
+}
+
+# Registro por defecto; un archivo JSON con --comandos puede reemplazarlo.
+# Mismo formato: los colores pueden ser un nombre de COLORS o [r, g, b]
+DEFAULT_COMMANDS = {
+    "gestures": GESTURE_COMMANDS,
+    "controls": GESTURE_CONTROL,
+    "keys": KEY_COMMANDS
+}
+
+# Efecto de cada comando en el estado local: valor del parámetro ->
+# (dispositivo, cambios del dispositivo, cambios de los contadores de Room)
+COMMAND_EFFECTS = {
+    "LED_ON": lambda value: ("Luces", {"state": "ON", "color": GREEN}, {}),
+    "LED_OFF": lambda value: ("Luces", {"state": "OFF", "color": RED}, {}),
+    "FAN_ON": lambda value: ("Ventilador", {"state": "255/255", "color": GREEN, "value": 255}, {"fan_speed": 255}),
+    "FAN_OFF": lambda value: ("Ventilador", {"state": "0/255", "color": RED, "value": 0}, {"fan_speed": 0}),
+    "FAN_SPEED": lambda speed: ("Ventilador", {"state": f"{speed}/255", "color": GREEN if speed > 0 else RED, "value": speed}, {"fan_speed": speed}),
+    "FAN_REVERSE": lambda value: ("Ventilador", {"state": "255/255 (R)", "color": ORANGE, "value": 255}, {"fan_speed": 255}),
+    "DOOR_SET_ANGLE": lambda angle: ("Puerta", {"state": f"{angle}°", "value": angle}, {"servo_angle": angle})
+}
+
+# Comandos que requieren un valor entero: NOMBRE=N
+PARAMETERIZED_COMMANDS = {"FAN_SPEED", "DOOR_SET_ANGLE"}
+
+class Command:
+    """Comando interpretado una sola vez: texto para el Arduino y efecto local"""
+    __slots__ = ("text", "name", "value", "device", "updates", "room_updates")
+
+    def __init__(self, text):
+        self.text = text
+        self.name, _, param = text.partition("=")
+        self.value = None
+        if self.name in PARAMETERIZED_COMMANDS:
+            try:
+                self.value = int(param)
+            except ValueError:
+                raise ValueError(f"El comando {text!r} requiere un valor entero ({self.name}=N)") from None
+        effect = COMMAND_EFFECTS.get(self.name)
+        self.device, self.updates, self.room_updates = effect(self.value) if effect else (None, None, {})
+
+class GestureBinding:
+    """Acciones asociadas a una máscara de dedos"""
+    __slots__ = ("command", "desc", "color", "control", "step")
+
+    def __init__(self):
+        self.command = None
+        self.desc = None
+        self.color = WHITE
+        self.control = None  # Función de CONTROL_TARGETS
+        self.step = 0
+
+def step_servo(room, step):
+    room.servo_angle = max(0, min(180, room.servo_angle + step))
+    return f"DOOR_SET_ANGLE={room.servo_angle}"
+
+def step_fan(room, step):
+    room.fan_speed = max(0, min(255, room.fan_speed + step))
+    return f"FAN_SPEED={room.fan_speed}"
+
+CONTROL_TARGETS = {"SERVO": step_servo, "FAN": step_fan}
+CONTROL_ACTIONS = {"INCREASE": 1, "DECREASE": -1}
+
+# Teclas que la aplicación ya usa y el registro no puede asignar
+HAND_GRAPH_KEY = K_g
+RESERVED_KEYS = {K_ESCAPE, HAND_GRAPH_KEY}
+
+def required_field(entry, key, where):
+    if key not in entry:
+        raise ValueError(f"{where}: falta el campo {key!r}")
+    return entry[key]
+
+def fingers_to_mask(fingers):
+    """Convierte "01100" en la máscara 0b01100 (el pulgar es el bit más alto)"""
+    if len(fingers) != 5 or set(fingers) - {"0", "1"}:
+        raise ValueError(f"Estado de dedos inválido: {fingers!r}")
+    return int(fingers, 2)
+
+def format_fingers(mask):
+    return "-----" if mask is None else f"{mask:05b}"
+
+class CommandRegistry:
+    """Tabla de despacho compilada a partir del registro declarativo.
+
+    gestures: lista de 32 GestureBinding indexada por máscara de dedos.
+    keys: código de tecla -> Command.
+    """
+
+    def __init__(self, config=DEFAULT_COMMANDS):
+        self._commands = {}
+        self.gestures = [GestureBinding() for _ in range(32)]
+
+        for fingers, entry in config.get("gestures", {}).items():
+            where = f"Gesto {fingers!r}"
+            binding = self.gestures[fingers_to_mask(fingers)]
+            binding.command = self._entry_command(required_field(entry, "cmd", where), where)
+            binding.desc = entry.get("desc", entry["cmd"])
+            color = entry.get("color", WHITE)
+            if isinstance(color, str) and color not in COLORS:
+                raise ValueError(f"{where}: color desconocido {color!r}")
+            binding.color = COLORS[color] if isinstance(color, str) else tuple(color)
+
+        for fingers, entry in config.get("controls", {}).items():
+            where = f"Control {fingers!r}"
+            target = required_field(entry, "target", where)
+            action = required_field(entry, "action", where)
+            step = required_field(entry, "step", where)
+            if target not in CONTROL_TARGETS:
+                raise ValueError(f"{where}: objetivo de control desconocido {target!r}")
+            if action not in CONTROL_ACTIONS:
+                raise ValueError(f"{where}: acción desconocida {action!r} (INCREASE o DECREASE)")
+            if not isinstance(step, int):
+                raise ValueError(f"{where}: el paso debe ser un entero")
+            binding = self.gestures[fingers_to_mask(fingers)]
+            binding.control = CONTROL_TARGETS[target]
+            binding.step = step * CONTROL_ACTIONS[action]
+
+        self.keys = {}
+        for name, cmd in config.get("keys", {}).items():
+            key = getattr(pygame, f"K_{name}", None)
+            if key is None:
+                raise ValueError(f"Tecla desconocida: {name!r}")
+            if key in RESERVED_KEYS:
+                raise ValueError(f"Tecla reservada por la aplicación: {name!r}")
+            self.keys[key] = self._entry_command(cmd, f"Tecla {name!r}")
+
+    def _entry_command(self, text, where):
+        try:
+            return self.command(text)
+        except ValueError as e:
+            raise ValueError(f"{where}: {e}") from None
+
+    @classmethod
+    def from_file(cls, path):
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def command(self, text):
+        """Devuelve el Command de un texto, interpretándolo solo la primera vez"""
+        command = self._commands.get(text)
+        if command is None:
+            command = self._commands[text] = Command(text)
+        return command
+
+DEFAULT_REGISTRY = CommandRegistry()
+
+def count_fingers(hand_landmarks):
+    tips_ids = [4, 8, 12, 16, 20]  # Pulgar, índice, medio, anular, meñique
+    fingers = []
+
+    # Detección pulgar (comparación eje X)
+    thumb_tip = hand_landmarks.landmark[tips_ids[0]]
+    thumb_dip = hand_landmarks.landmark[tips_ids[0]-1]
+    fingers.append(1 if thumb_tip.x < thumb_dip.x else 0)
+
+    # Detección otros dedos (comparación eje Y)
+    for id in range(1, 5):
+        tip = hand_landmarks.landmark[tips_ids[id]]
+        dip = hand_landmarks.landmark[tips_ids[id]-2]
+        fingers.append(1 if tip.y < dip.y else 0)
+
+    mask = 0
+    for finger in fingers:
+        mask = (mask << 1) | finger
+    return mask
+
+def open_serial(port=SERIAL_PORT, baud_rate=BAUD_RATE):
+    """Abre el puerto serial y espera el reinicio del Arduino; None si falla"""
+    import serial
+    try:
+        arduino = serial.Serial(port, baud_rate, timeout=1)
+        time.sleep(ARDUINO_RESET_DELAY)  # Espera para inicialización
+        print(f"Conexión establecida con Arduino en {port}")
+        return arduino
+    except serial.SerialException as e:
+        print(f"Error de conexión: {e}")
+        return None
+
+def open_camera(index=0):
+    """Abre la cámara; lanza RuntimeError si no está disponible"""
+    import cv2
+    cap = cv2.VideoCapture(index)
+    if not cap.isOpened():
+        cap.release()
+        raise RuntimeError("Error al abrir la cámara")
+    return cap
+
+def load_hands_model():
+    """Carga el modelo de MediaPipe Hands"""
+    import mediapipe as mp
+    return mp.solutions.hands.Hands(
+        max_num_hands=1,
+        min_detection_confidence=0.8,
+        min_tracking_confidence=0.8
+    )
+
+def load_fonts():
+    return {
+        "large": pygame.font.SysFont('Arial', 30),
+        "medium": pygame.font.SysFont('Arial', 24),
+        "small": pygame.font.SysFont('Arial', 18),
+    }
+
+def draw_hand_graph(hand_landmarks, size=(300, 300)):
+    """Crea una gráfica de los puntos de la mano usando matplotlib"""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib import pyplot as plt
+    import mediapipe as mp
+
+    fig, ax = plt.subplots(figsize=(4, 4), facecolor='black')
+    fig.subplots_adjust(left=0, right=1, bottom=0, top=1)
+    ax.set_xlim(0, 1)
+    ax.set_ylim(1, 0)  # Invertir eje Y para coincidir con imagen
+    ax.axis('off')
+
+    # Dibujar conexiones
+    connections = mp.solutions.hands.HAND_CONNECTIONS
+    for connection in connections:
+        start_idx = connection[0]
+        end_idx = connection[1]
+        start = hand_landmarks.landmark[start_idx]
+        end = hand_landmarks.landmark[end_idx]
+        ax.plot([start.x, end.x], [start.y, end.y], 'w-', linewidth=2)
+
+    # Dibujar puntos
+    for landmark in hand_landmarks.landmark:
+        ax.plot(landmark.x, landmark.y, 'ro', markersize=5)
+
+    # Convertir a superficie pygame
+    canvas = FigureCanvasAgg(fig)
+    canvas.draw()
+    renderer = canvas.get_renderer()
+    raw_data = renderer.tostring_argb()
+    plt.close(fig)
+
+    # Cambiado de "RGB" a "ARGB" y ajustado el tamaño
+    size_pixels = (int(renderer.width), int(renderer.height))
+    surf = pygame.image.fromstring(raw_data, size_pixels, "ARGB")
+    return pygame.transform.scale(surf, size)
+
+def draw_gesture_info(surface, fonts, registry, finger_state, command, servo_angle, fan_speed):
+    """Dibuja información sobre el gesto detectado"""
+    # Fondo del panel de información
+    pygame.draw.rect(surface, (30, 30, 40), (0, 0, surface.get_width(), 120))
+
+    # Texto de estado de dedos
+    binding = registry.gestures[finger_state] if finger_state is not None else None
+    desc = binding.desc if binding and binding.desc else "Gestos no reconocido"
+    color = binding.color if binding and binding.desc else WHITE
+    fingers_text = fonts["large"].render(f"Estado de dedos: {format_fingers(finger_state)}", True, color)
+    surface.blit(fingers_text, (20, 20))
+
+    # Descripción del gesto
+    gesture_text = fonts["medium"].render(f"Gesto: {desc}", True, WHITE)
+    surface.blit(gesture_text, (20, 55))
+
+    # Comando actual
+    cmd_text = fonts["medium"].render(f"Comando: {command if command else 'Ninguno'}", True, GREEN if command else RED)
+    surface.blit(cmd_text, (surface.get_width() - 400, 20))
+
+    # Ángulo del servo
+    servo_text = fonts["medium"].render(f"Ángulo puerta: {servo_angle}°", True, WHITE)
+    surface.blit(servo_text, (surface.get_width() - 400, 55))
+
+    # Velocidad ventilador
+    fan_text = fonts["medium"].render(f"Veloc. ventilador: {fan_speed}/255", True, WHITE)
+    surface.blit(fan_text, (surface.get_width() - 400, 85))
+
+def draw_device_status(surface, fonts, devices):
+    """Dibuja el estado de los dispositivos"""
+    # Fondo del panel de estado
+    pygame.draw.rect(surface, (40, 40, 50), (0, surface.get_height() - 150, surface.get_width(), 150))
+
+    # Título
+    status_title = fonts["large"].render("Estado de Dispositivos:", True, YELLOW)
+    surface.blit(status_title, (20, surface.get_height() - 140))
+
+    # Dispositivos
+    for i, device in enumerate(devices):
+        x_pos = 20 + (i * 250)
+        if x_pos < surface.get_width() - 200:
+            # Icono representativo
+            icon = fonts["large"].render(device["icon"], True, device["color"])
+            surface.blit(icon, (x_pos, surface.get_height() - 100))
+
+            # Texto del estado
+            state_text = fonts["medium"].render(device["state"], True, device["color"])
+            surface.blit(state_text, (x_pos + 40, surface.get_height() - 100))
+
+            # Barra de progreso para elementos con valores
+            if "value" in device:
+                pygame.draw.rect(surface, (70, 70, 80), (x_pos, surface.get_height() - 60, 200, 20))
+                pygame.draw.rect(surface, device["color"], (x_pos, surface.get_height() - 60, int(200 * (device["value"]/device["max"])), 20))
+                value_text = fonts["small"].render(f"{device['value']}/{device['max']}", True, WHITE)
+                surface.blit(value_text, (x_pos + 80, surface.get_height() - 55))
+
+def parse_status_message(message):
+    """Parsea el mensaje de estado del Arduino"""
+    if not message.startswith("status:"):
+        return None
+
+    status_data = {}
+    parts = message[7:].strip().split(",")
+    for part in parts:
+        key, value = part.split("=")
+        status_data[key] = value
+
+    return status_data
+
+def initial_devices():
+    """Dispositivos iniciales"""
+    return [
+        {"name": "Luces", "state": "OFF", "color": RED, "icon": "💡", "cmd_on": "LED_ON", "cmd_off": "LED_OFF"},
+        {"name": "Ventilador", "state": "OFF", "color": RED, "icon": "🌀", "value": 0, "max": 255, "cmd_on": "FAN_ON", "cmd_off": "FAN_OFF", "cmd_reverse": "FAN_REVERSE"},
+        {"name": "Alarma", "state": "OFF", "color": RED, "icon": "🚨", "cmd_on": "BUZZER_ON"},
+        {"name": "Puerta", "state": "90°", "color": BLUE, "icon": "🚪", "value": 90, "max": 180, "cmd_open": "DOOR_OPEN", "cmd_close": "DOOR_CLOSE"}
+    ]
+
+class Room:
+    """Estado de los dispositivos de una habitación y su Arduino"""
+
+    def __init__(self, arduino=None, registry=DEFAULT_REGISTRY):
+        self.arduino = arduino
+        self.registry = registry
+        self.devices = initial_devices()
+        self.devices_by_name = {device["name"]: device for device in self.devices}
+        self.prev_command = None
+        self.servo_angle = 90  # Ángulo inicial del servo
+        self.fan_speed = 0     # Velocidad inicial del ventilador
+        self.last_status = {}
+        self.gesture_active_time = 0
+        self.current_gesture = None
+
+    def send_command(self, cmd):
+        if self.arduino:
+            try:
+                self.arduino.write(f"{cmd}\n".encode())
+                print(f"Comando enviado: {cmd}")
+                return True
+            except Exception as e:
+                print(f"Error enviando comando: {e}")
+                return False
+        else:
+            print(f"Simulando comando: {cmd}")
+            return True
+
+    def read_status(self):
+        """Lee el estado del Arduino si hay datos disponibles"""
+        if self.arduino and self.arduino.in_waiting > 0:
+            try:
+                status_message = self.arduino.readline().decode().strip()
+                self.last_status = parse_status_message(status_message) or self.last_status
+                print(f"Estado recibido: {status_message}")
+            except Exception as e:
+                print(f"Error leyendo estado: {e}")
+
+        # Actualizar dispositivos basado en el último estado
+        if self.last_status:
+            for device in self.devices:
+                if device["name"] == "Luces":
+                    device["state"] = "ON" if self.last_status.get("led", "") == "on" else "OFF"
+                    device["color"] = GREEN if device["state"] == "ON" else RED
+                elif device["name"] == "Ventilador":
+                    speed = int(self.last_status.get("fan", "0"))
+                    device["value"] = speed
+                    device["state"] = f"{speed}/255"
+                    device["color"] = GREEN if speed > 0 else RED
+                    if "fan_dir" in self.last_status:
+                        if self.last_status["fan_dir"] == "reverse":
+                            device["state"] += " (R)"
+                elif device["name"] == "Alarma":
+                    device["state"] = "ON" if self.last_status.get("buzzer", "") == "on" else "OFF"
+                    device["color"] = ORANGE if device["state"] == "ON" else RED
+                elif device["name"] == "Puerta":
+                    angle = int(self.last_status.get("door", "90"))
+                    device["value"] = angle
+                    device["state"] = f"{angle}°"
+                    self.servo_angle = angle
+
+    def gesture_command(self, finger_state):
+        """Devuelve el Command asociado a una máscara de dedos, incluido el control progresivo"""
+        binding = self.registry.gestures[finger_state]
+        command = binding.command
+
+        # Control progresivo con gestos especiales
+        if binding.control:
+            if self.current_gesture != finger_state:
+                self.current_gesture = finger_state
+                self.gesture_active_time = time.time()
+
+            # Aplicar acción continua si el gesto se mantiene
+            if time.time() - self.gesture_active_time > 0.5:  # Retardo antes de acción continua
+                command = self.registry.command(binding.control(self, binding.step))
+        else:
+            self.current_gesture = None
+
+        return command
+
+    def dispatch(self, command):
+        """Envío de comandos con deduplicación"""
+        if command and command.text != self.prev_command:
+            if self.send_command(command.text):
+                self.prev_command = command.text
+                self.apply_command(command)
+
+    def apply_command(self, command):
+        # Actualizar estado local inmediatamente para mejor feedback
+        if command.device:
+            self.devices_by_name[command.device].update(command.updates)
+        for counter, value in command.room_updates.items():
+            setattr(self, counter, value)
+
+    def close(self):
+        if self.arduino:
+            self.arduino.close()
+
+class GestureApp:
+    """Aplicación de control por gestos con arranque diferido.
+
+    La ventana se abre de inmediato; el puerto serial, la cámara y el modelo
+    de manos se inicializan en paralelo mientras se muestra "Iniciando".
+    """
+
+    def __init__(self, serial_port=SERIAL_PORT, camera_index=0, hand_graph=False, registry=DEFAULT_REGISTRY):
+        self.start_time = time.perf_counter()
+        self.serial_port = serial_port
+        self.camera_index = camera_index
+        self.hand_graph = hand_graph
+        self.registry = registry
+        self.room = Room(registry=registry)
+        self.cap = None
+        self.hands = None
+        self.loading = {}
+        self.loading_done = False
+        self.load_times = {}
+        self.load_errors = {}
+        self.ready = False
+        self.startup_time = None
+        self.running = True
+
+    def _timed(self, name, loader, *args):
+        start = time.perf_counter()
+        try:
+            return loader(*args)
+        finally:
+            self.load_times[name] = time.perf_counter() - start
+
+    def start(self):
+        # Inicializar pygame para interfaz gráfica
+        pygame.init()
+        info = pygame.display.Info()
+        self.screen_width, self.screen_height = info.current_w - 100, info.current_h - 100
+        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
+        pygame.display.set_caption("Control por Gestos - Sistema de Domótica")
+        self.fonts = load_fonts()
+        self.clock = pygame.time.Clock()
+        self.window_time = time.perf_counter() - self.start_time
+
+        # Inicialización de hardware y modelo en paralelo
+        self.executor = ThreadPoolExecutor(max_workers=3)
+        self.loading = {
+            "Arduino": self.executor.submit(self._timed, "Arduino", open_serial, self.serial_port, BAUD_RATE),
+            "Cámara": self.executor.submit(self._timed, "Cámara", open_camera, self.camera_index),
+            "Modelo de manos": self.executor.submit(self._timed, "Modelo de manos", load_hands_model),
+        }
+
+    def _collect_loaded(self):
+        """Recoge los recursos inicializados; False si falta la cámara o el modelo.
+
+        Los errores quedan en load_errors; lo que sí cargó se guarda para
+        liberarlo en close(). Sin Arduino se simulan los comandos.
+        """
+        self.executor.shutdown()
+        self.loading_done = True
+        for name, future in self.loading.items():
+            error = future.exception()
+            if error:
+                self.load_errors[name] = str(error) or type(error).__name__
+                print(f"Error al iniciar {name}: {self.load_errors[name]}")
+        if "Arduino" not in self.load_errors:
+            self.room.arduino = self.loading["Arduino"].result()
+        if "Modelo de manos" not in self.load_errors:
+            self.hands = self.loading["Modelo de manos"].result()
+        if "Cámara" not in self.load_errors:
+            self.cap = self.loading["Cámara"].result()
+        if self.cap is None or self.hands is None:
+            return False
+
+        # cv2 ya fue importado por open_camera; se enlaza una sola vez
+        import cv2
+        import numpy as np
+        self.cv2 = cv2
+        self.np = np
+        return True
+
+    def _poll_startup(self):
+        if not self.loading_done and all(future.done() for future in self.loading.values()):
+            self.ready = self._collect_loaded()
+
+    def _report_startup(self):
+        self.startup_time = time.perf_counter() - self.start_time
+        details = ", ".join(f"{name} {elapsed:.2f} s" for name, elapsed in self.load_times.items())
+        print(f"Arranque: ventana en {self.window_time:.2f} s, listo en {self.startup_time:.2f} s ({details})")
+        if self.startup_time > STARTUP_BUDGET:
+            print(f"Aviso: el arranque superó el presupuesto de {STARTUP_BUDGET:.1f} s")
+
+    def draw_warming_up(self):
+        self.screen.fill(BLACK)
+        title = self.fonts["large"].render("Iniciando sistema...", True, YELLOW)
+        self.screen.blit(title, (self.screen_width // 2 - title.get_width() // 2, self.screen_height // 2 - 80))
+        for i, (name, future) in enumerate(self.loading.items()):
+            if name in self.load_errors:
+                label, color = f"error: {self.load_errors[name]}", RED
+            elif future.done():
+                label, color = "listo", GREEN
+            else:
+                label, color = "cargando", WHITE
+            text = self.fonts["medium"].render(f"{name}: {label}", True, color)
+            self.screen.blit(text, (self.screen_width // 2 - 120, self.screen_height // 2 - 20 + i * 35))
+        if self.loading_done:
+            status = "No se pudo iniciar - Esc para salir"
+        else:
+            status = f"{time.perf_counter() - self.start_time:.1f} s"
+        elapsed = self.fonts["small"].render(status, True, WHITE)
+        self.screen.blit(elapsed, (self.screen_width // 2 - elapsed.get_width() // 2, self.screen_height // 2 + 100))
+
+    def handle_events(self):
+        for event in pygame.event.get():
+            if event.type == QUIT or (event.type == KEYDOWN and event.key == K_ESCAPE):
+                self.running = False
+            elif event.type == KEYDOWN and event.key == HAND_GRAPH_KEY:
+                self.hand_graph = not self.hand_graph
+            elif event.type == KEYDOWN and self.ready and event.key in self.registry.keys:
+                self.room.dispatch(self.registry.keys[event.key])
+
+    def process_frame(self):
+        cv2 = self.cv2
+        np = self.np
+
+        room = self.room
+        room.read_status()
+
+        # Capturar frame de la cámara
+        ret, frame = self.cap.read()
+        if not ret:
+            return False
+
+        frame = cv2.flip(frame, 1)
+        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        results = self.hands.process(rgb_frame)
+
+        command = None
+        finger_state = None
+        hand_graph_surf = None
+
+        if results.multi_hand_landmarks:
+            for hand_landmarks in results.multi_hand_landmarks:
+                # Procesar gestos
+                finger_state = count_fingers(hand_landmarks)
+                command = room.gesture_command(finger_state)
+
+                # Crear gráfico de la mano
+                if self.hand_graph:
+                    try:
+                        hand_graph_surf = draw_hand_graph(hand_landmarks)
+                    except Exception as e:
+                        print(f"Error al dibujar gráfico de mano: {e}")
+                        hand_graph_surf = None
+
+        room.dispatch(command)
+
+        # Convertir frame de OpenCV a Pygame
+        frame = np.rot90(rgb_frame)
+        frame = pygame.surfarray.make_surface(frame)
+        frame = pygame.transform.scale(frame, (self.screen_width // 2, self.screen_height - 150))
+
+        # Limpiar pantalla
+        self.screen.fill(BLACK)
+
+        # Dibujar frame de la cámara
+        self.screen.blit(frame, (20, 130))
+
+        # Dibujar gráfico de la mano si está disponible
+        if hand_graph_surf:
+            self.screen.blit(hand_graph_surf, (self.screen_width // 2 + 40, 130))
+        elif finger_state is None:
+            no_hand_text = self.fonts["large"].render("Muestra tu mano a la cámara", True, WHITE)
+            self.screen.blit(no_hand_text, (self.screen_width // 2 + 100, self.screen_height // 2))
+
+        # Dibujar información de gestos
+        draw_gesture_info(self.screen, self.fonts, self.registry, finger_state, command and command.text,
+                          room.servo_angle, room.fan_speed)
+
+        # Dibujar estado de dispositivos
+        draw_device_status(self.screen, self.fonts, room.devices)
+
+        # Dibujar ayuda de teclado
+        help_text = self.fonts["small"].render("Teclas: 1=LED ON, 2=LED OFF, 3=FAN ON, 4=FAN OFF, 5=BUZZER, 6=OPEN, 7=CLOSE, 0=ALL OFF, R=REVERSE, G=GRÁFICA", True, WHITE)
+        self.screen.blit(help_text, (20, self.screen_height - 30))
+        return True
+
+    def run(self):
+        self.start()
+        try:
+            while self.running:
+                self.handle_events()
+
+                if not self.ready:
+                    self._poll_startup()
+                    if not self.ready:
+                        self.draw_warming_up()
+                        pygame.display.flip()
+                        self.clock.tick(30)
+                        continue
+
+                if not self.process_frame():
+                    continue
+                if self.startup_time is None:
+                    self._report_startup()
+
+                # Actualizar pantalla
+                pygame.display.flip()
+                self.clock.tick(30)
+        finally:
+            self.close()
+
+    def close(self):
+        # Liberar recursos
+        if self.loading and not self.loading_done:
+            self._collect_loaded()  # Espera a las cargas pendientes
+        if self.hands:
+            self.hands.close()
+        if self.cap:
+            self.cap.release()
+        pygame.quit()
+        self.room.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Control por gestos - Sistema de Domótica")
+    parser.add_argument("--puerto", default=SERIAL_PORT, help="Puerto serial del Arduino")
+    parser.add_argument("--camara", type=int, default=0, help="Índice de la cámara")
+    parser.add_argument("--grafica-mano", action="store_true", help="Mostrar la gráfica de la mano (usa matplotlib)")
+    parser.add_argument("--comandos", help="Registro de gestos, controles y teclas en JSON (ver DEFAULT_COMMANDS)")
+    args = parser.parse_args()
+    registry = CommandRegistry.from_file(args.comandos) if args.comandos else DEFAULT_REGISTRY
+    GestureApp(args.puerto, args.camara, args.grafica_mano, registry).run()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+"""Control por gestos para varias habitaciones desde un solo equipo.
+
+Cada cámara tiene su propio proceso de inferencia (MediaPipe retiene el GIL),
+que envía al coordinador el estado de los dedos y los puntos de la mano por
+un Pipe, y una miniatura del frame por memoria compartida. El coordinador
+envía los comandos al Arduino de cada habitación y dibuja un panel combinado.
+
+Uso:
+    python control_gestos_multi.py --sala Sala:0:COM3 --sala Cocina:1:COM4
+"""
+import argparse
+import math
+import multiprocessing
+import time
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+import pygame
+from pygame.locals import *
+
+from control_gestos import (BAUD_RATE, BLACK, DEFAULT_REGISTRY, GREEN, RED, WHITE, YELLOW, CommandRegistry,
+                            Room, count_fingers, format_fingers, load_fonts, load_hands_model, open_camera,
+                            open_serial)
+
+# Miniatura que cada proceso deja en memoria compartida
+THUMB_WIDTH, THUMB_HEIGHT = 320, 240
+
+# Lecturas fallidas seguidas antes de dar la cámara por perdida (~2 s)
+MAX_FAILED_READS = 100
+FAILED_READ_DELAY = 0.02
+
+def camera_worker(camera_index, conn, shm_name, stop_event):
+    """Proceso de inferencia de una cámara.
+
+    Mensajes enviados por conn:
+        ("ready",)
+        ("state", máscara de dedos o None, puntos de la mano (bytes float32 x,y) o None)
+        ("error", mensaje)
+    """
+    import cv2
+
+    cap = None
+    try:
+        cap = open_camera(camera_index)
+        hands = load_hands_model()
+    except Exception as e:
+        if cap:
+            cap.release()
+        conn.send(("error", str(e)))
+        return
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    thumb = np.ndarray((THUMB_HEIGHT, THUMB_WIDTH, 3), dtype=np.uint8, buffer=shm.buf)
+    conn.send(("ready",))
+    failed_reads = 0
+    try:
+        while not stop_event.is_set():
+            ret, frame = cap.read()
+            if not ret:
+                failed_reads += 1
+                if failed_reads >= MAX_FAILED_READS:
+                    conn.send(("error", "cámara sin frames"))
+                    break
+                time.sleep(FAILED_READ_DELAY)
+                continue
+            failed_reads = 0
+
+            frame = cv2.flip(frame, 1)
+            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            results = hands.process(rgb_frame)
+
+            finger_state = None
+            landmarks = None
+            if results.multi_hand_landmarks:
+                hand_landmarks = results.multi_hand_landmarks[0]
+                finger_state = count_fingers(hand_landmarks)
+                landmarks = np.array([(lm.x, lm.y) for lm in hand_landmarks.landmark],
+                                     dtype=np.float32).tobytes()
+
+            # La miniatura se sobrescribe sin bloqueo: un frame mezclado solo afecta la vista previa
+            thumb[:] = cv2.resize(rgb_frame, (THUMB_WIDTH, THUMB_HEIGHT))
+            conn.send(("state", finger_state, landmarks))
+    except (BrokenPipeError, EOFError):
+        pass  # El coordinador ya cerró
+    finally:
+        del thumb
+        shm.close()
+        hands.close()
+        cap.release()
+
+class RoomStream:
+    """Una habitación: su cámara (proceso de inferencia), su Arduino y su estado"""
+
+    def __init__(self, name, camera_index, serial_port, context, registry=DEFAULT_REGISTRY):
+        self.name = name
+        self.camera_index = camera_index
+        self.serial_port = serial_port
+        self.room = Room(registry=registry)
+        self.status = "iniciando"
+        self.finger_state = None
+        self.landmarks = None
+        self.last_command = None
+        self.fps = 0.0
+        self._frames = 0
+        self._fps_time = time.perf_counter()
+
+        self.shm = shared_memory.SharedMemory(create=True, size=THUMB_WIDTH * THUMB_HEIGHT * 3)
+        self.thumb = np.ndarray((THUMB_HEIGHT, THUMB_WIDTH, 3), dtype=np.uint8, buffer=self.shm.buf)
+        self.thumb[:] = 0
+        self.conn, self._child_conn = context.Pipe(duplex=False)
+        self.stop_event = context.Event()
+        self.process = context.Process(target=camera_worker, name=f"camara-{name}", daemon=True,
+                                       args=(camera_index, self._child_conn, self.shm.name, self.stop_event))
+
+    def start(self):
+        self.process.start()
+        # Solo el proceso hijo escribe; así recv() detecta cuando termina
+        self._child_conn.close()
+
+    def poll(self):
+        """Procesa los mensajes pendientes del proceso de inferencia"""
+        while self.conn.poll():
+            try:
+                message = self.conn.recv()
+            except EOFError:
+                # El proceso terminó: deja de mostrar sus últimos FPS
+                if self.status == "activo":
+                    self.status = "detenido"
+                self.fps = 0.0
+                self._frames = 0
+                return
+
+            if message[0] == "ready":
+                self.status = "activo"
+            elif message[0] == "error":
+                self.status = f"error: {message[1]}"
+            else:
+                _, finger_state, landmarks = message
+                self._frames += 1
+                self.finger_state = finger_state
+                self.landmarks = np.frombuffer(landmarks, dtype=np.float32).reshape(-1, 2) if landmarks else None
+                if finger_state is not None:
+                    command = self.room.gesture_command(finger_state)
+                    if command:
+                        self.last_command = command.text
+                    self.room.dispatch(command)
+
+        now = time.perf_counter()
+        if now - self._fps_time >= 1.0:
+            self.fps = self._frames / (now - self._fps_time)
+            self._frames = 0
+            self._fps_time = now
+
+    def close(self):
+        self.stop_event.set()
+        if self.process.pid is None:
+            self._child_conn.close()  # start() no llegó a ejecutarse
+        else:
+            # Vaciar el pipe mientras se espera: un proceso bloqueado en send()
+            # no vería stop_event y no liberaría la cámara ni el modelo
+            deadline = time.perf_counter() + 2
+            while self.process.is_alive() and time.perf_counter() < deadline:
+                try:
+                    while self.conn.poll():
+                        self.conn.recv()
+                except EOFError:
+                    pass
+                self.process.join(timeout=0.05)
+            if self.process.is_alive():
+                self.process.terminate()
+        self.conn.close()
+        del self.thumb
+        self.shm.close()
+        self.shm.unlink()
+        self.room.close()
+
+class MultiRoomApp:
+    """Coordinador: recibe los gestos de todas las cámaras y dibuja el panel"""
+
+    def __init__(self, rooms, registry=DEFAULT_REGISTRY):
+        context = multiprocessing.get_context("spawn")
+        self.streams = [RoomStream(name, camera, port, context, registry) for name, camera, port in rooms]
+        self.executor = None
+        self.serial_futures = {}
+        self.running = True
+
+    def start(self):
+        pygame.init()
+        info = pygame.display.Info()
+        self.screen_width, self.screen_height = info.current_w - 100, info.current_h - 100
+        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
+        pygame.display.set_caption("Control por Gestos - Panel de Habitaciones")
+        self.fonts = load_fonts()
+        self.clock = pygame.time.Clock()
+
+        for stream in self.streams:
+            stream.start()
+
+        # Los puertos seriales se abren en paralelo (cada uno espera el reinicio del Arduino)
+        self.executor = ThreadPoolExecutor(max_workers=len(self.streams))
+        self.serial_futures = {
+            stream: self.executor.submit(open_serial, stream.serial_port, BAUD_RATE)
+            for stream in self.streams if stream.serial_port
+        }
+
+    def _poll_serial(self):
+        for stream, future in list(self.serial_futures.items()):
+            if future.done():
+                if future.exception():
+                    # Sin Arduino se simulan los comandos, como con un puerto que no abre
+                    print(f"Error al iniciar Arduino de {stream.name}: {future.exception()}")
+                else:
+                    stream.room.arduino = future.result()
+                del self.serial_futures[stream]
+
+    def draw_room(self, stream, rect):
+        x, y, width, height = rect
+        pygame.draw.rect(self.screen, (30, 30, 40), rect)
+
+        # Miniatura de la cámara con los puntos de la mano
+        preview_height = height - 130
+        preview_width = min(width - 20, preview_height * THUMB_WIDTH // THUMB_HEIGHT)
+        surf = pygame.surfarray.make_surface(stream.thumb.swapaxes(0, 1))
+        surf = pygame.transform.scale(surf, (preview_width, preview_height))
+        if stream.landmarks is not None:
+            for lx, ly in stream.landmarks:
+                pygame.draw.circle(surf, RED, (int(lx * preview_width), int(ly * preview_height)), 3)
+        self.screen.blit(surf, (x + 10, y + 40))
+
+        # Encabezado
+        color = GREEN if stream.status == "activo" else (RED if stream.status.startswith("error") else YELLOW)
+        title = self.fonts["medium"].render(f"{stream.name} - {stream.status} ({stream.fps:.0f} FPS)", True, color)
+        self.screen.blit(title, (x + 10, y + 8))
+
+        # Gesto, comando y dispositivos
+        info_y = y + 50 + preview_height
+        gesture = self.fonts["small"].render(
+            f"Dedos: {format_fingers(stream.finger_state)}   Comando: {stream.last_command or 'Ninguno'}", True, WHITE)
+        self.screen.blit(gesture, (x + 10, info_y))
+        for i, device in enumerate(stream.room.devices):
+            text = self.fonts["small"].render(f"{device['name']}: {device['state']}", True, device["color"])
+            self.screen.blit(text, (x + 10 + (i % 2) * (width // 2), info_y + 25 + (i // 2) * 22))
+
+    def draw_dashboard(self):
+        self.screen.fill(BLACK)
+        columns = math.ceil(math.sqrt(len(self.streams)))
+        rows = math.ceil(len(self.streams) / columns)
+        tile_width = self.screen_width // columns
+        tile_height = (self.screen_height - 30) // rows
+        for i, stream in enumerate(self.streams):
+            rect = ((i % columns) * tile_width + 5, (i // columns) * tile_height + 5, tile_width - 10, tile_height - 10)
+            self.draw_room(stream, rect)
+
+        help_text = self.fonts["small"].render("Esc: Salir", True, WHITE)
+        self.screen.blit(help_text, (20, self.screen_height - 25))
+
+    def run(self):
+        try:
+            self.start()
+            while self.running:
+                for event in pygame.event.get():
+                    if event.type == QUIT or (event.type == KEYDOWN and event.key == K_ESCAPE):
+                        self.running = False
+
+                self._poll_serial()
+                for stream in self.streams:
+                    stream.poll()
+                    stream.room.read_status()
+
+                self.draw_dashboard()
+                pygame.display.flip()
+                self.clock.tick(30)
+        finally:
+            self.close()
+
+    def close(self):
+        # Liberar recursos (también si start() falló a medias)
+        if self.executor:
+            self.executor.shutdown()
+            self._poll_serial()
+        for stream in self.streams:
+            stream.close()
+        pygame.quit()
+
+def parse_room(value):
+    """NOMBRE:CAMARA[:PUERTO] -> (nombre, índice de cámara, puerto o None)"""
+    parts = value.split(":")
+    if len(parts) not in (2, 3):
+        raise argparse.ArgumentTypeError(f"Formato de sala inválido: {value!r} (NOMBRE:CAMARA[:PUERTO])")
+    try:
+        camera_index = int(parts[1])
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Índice de cámara inválido: {parts[1]!r}")
+    return parts[0], camera_index, parts[2] if len(parts) == 3 and parts[2] else None
+
+def main():
+    parser = argparse.ArgumentParser(description="Control por gestos - varias habitaciones")
+    parser.add_argument("--sala", dest="rooms", type=parse_room, action="append", required=True,
+                        help="Habitación como NOMBRE:CAMARA[:PUERTO]; sin puerto se simulan los comandos")
+    parser.add_argument("--comandos", help="Registro de gestos, controles y teclas en JSON (ver DEFAULT_COMMANDS)")
+    args = parser.parse_args()
+    registry = CommandRegistry.from_file(args.comandos) if args.comandos else DEFAULT_REGISTRY
+    MultiRoomApp(args.rooms, registry).run()
+
+if __name__ == "__main__":
+    main()